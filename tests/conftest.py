@@ -0,0 +1,52 @@
+"""
+Shared fixtures for the Mergington High School Activities API tests
+"""
+
+import copy
+
+import pytest
+from fastapi.testclient import TestClient
+from src.app import app, activities
+
+
+@pytest.fixture(scope="session")
+def client():
+    """Create a single test client for the FastAPI app, shared by all tests"""
+    # httpx.ASGITransport only supports async clients, so the sync tests go
+    # through TestClient; entering it as a context manager keeps one event
+    # loop portal open for the whole session instead of one per request
+    with TestClient(app) as c:
+        yield c
+
+
+# Snapshot of the in-memory database taken once at import, before any test
+# has mutated it; restored after each test
+_INITIAL_ACTIVITIES = copy.deepcopy(activities)
+
+
+@pytest.fixture(autouse=True)
+def reset_activities(request):
+    """Reset activities to initial state after each test"""
+    yield
+
+    # Tests marked read_only never mutate activities, so there is nothing to
+    # restore
+    if request.node.get_closest_marker("read_only"):
+        return
+
+    # Restore original state after test; only the participants lists are
+    # mutable, so the rest of each entry can be shared with the baseline
+    activities.clear()
+    activities.update({
+        name: {**details, "participants": list(details["participants"])}
+        for name, details in _INITIAL_ACTIVITIES.items()
+    })
+
+
+@pytest.fixture(scope="session")
+def baseline_participants():
+    """Participants of each activity in the initial state, as frozensets"""
+    return {
+        name: frozenset(details["participants"])
+        for name, details in _INITIAL_ACTIVITIES.items()
+    }
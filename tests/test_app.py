@@ -2,90 +2,14 @@
 Tests for the Mergington High School Activities API
 """
 
+import asyncio
+
+import httpx
 import pytest
-from fastapi.testclient import TestClient
 from src.app import app, activities
 
 
-@pytest.fixture
-def client():
-    """Create a test client for the FastAPI app"""
-    return TestClient(app)
-
-
-@pytest.fixture
-def reset_activities():
-    """Reset activities to initial state before each test"""
-    original_activities = {
-        "Chess Club": {
-            "description": "Learn strategies and compete in chess tournaments",
-            "schedule": "Fridays, 3:30 PM - 5:00 PM",
-            "max_participants": 12,
-            "participants": ["michael@mergington.edu", "daniel@mergington.edu"]
-        },
-        "Programming Class": {
-            "description": "Learn programming fundamentals and build software projects",
-            "schedule": "Tuesdays and Thursdays, 3:30 PM - 4:30 PM",
-            "max_participants": 20,
-            "participants": ["emma@mergington.edu", "sophia@mergington.edu"]
-        },
-        "Gym Class": {
-            "description": "Physical education and sports activities",
-            "schedule": "Mondays, Wednesdays, Fridays, 2:00 PM - 3:00 PM",
-            "max_participants": 30,
-            "participants": ["john@mergington.edu", "olivia@mergington.edu"]
-        },
-        "Soccer Club": {
-            "description": "Outdoor soccer training, drills and weekend matches",
-            "schedule": "Saturdays, 10:00 AM - 12:00 PM",
-            "max_participants": 22,
-            "participants": ["liam@mergington.edu", "noah@mergington.edu"]
-        },
-        "Basketball Team": {
-            "description": "Competitive basketball practices and interschool games",
-            "schedule": "Mondays and Thursdays, 5:00 PM - 7:00 PM",
-            "max_participants": 15,
-            "participants": ["ava@mergington.edu", "isabella@mergington.edu"]
-        },
-        "Art Club": {
-            "description": "Explore drawing, painting, and mixed media projects",
-            "schedule": "Wednesdays, 4:00 PM - 5:30 PM",
-            "max_participants": 20,
-            "participants": ["mia@mergington.edu", "charlotte@mergington.edu"]
-        },
-        "Drama Club": {
-            "description": "Acting workshops, rehearsals and school productions",
-            "schedule": "Fridays, 4:00 PM - 6:00 PM",
-            "max_participants": 25,
-            "participants": ["amelia@mergington.edu", "harper@mergington.edu"]
-        },
-        "Debate Team": {
-            "description": "Practice public speaking, argumentation and competitive debates",
-            "schedule": "Thursdays, 6:00 PM - 7:30 PM",
-            "max_participants": 16,
-            "participants": ["elijah@mergington.edu", "logan@mergington.edu"]
-        },
-        "Science Club": {
-            "description": "Hands-on experiments, science fairs and research projects",
-            "schedule": "Tuesdays, 4:00 PM - 5:30 PM",
-            "max_participants": 18,
-            "participants": ["lucas@mergington.edu", "zoe@mergington.edu"]
-        }
-    }
-    
-    # Store original state
-    original_state = {}
-    for key, value in activities.items():
-        original_state[key] = value.copy()
-    
-    yield
-    
-    # Restore original state after test
-    activities.clear()
-    for key, value in original_activities.items():
-        activities[key] = value.copy()
-
-
+@pytest.mark.read_only
 class TestRootEndpoint:
     """Tests for the root endpoint"""
     
@@ -96,10 +20,11 @@ class TestRootEndpoint:
         assert response.headers["location"] == "/static/index.html"
 
 
+@pytest.mark.read_only
 class TestActivitiesEndpoint:
     """Tests for the /activities endpoint"""
     
-    def test_get_all_activities(self, client, reset_activities):
+    def test_get_all_activities(self, client):
         """Test fetching all activities"""
         response = client.get("/activities")
         assert response.status_code == 200
@@ -110,7 +35,7 @@ class TestActivitiesEndpoint:
         assert "Chess Club" in data
         assert "Programming Class" in data
         
-    def test_activities_structure(self, client, reset_activities):
+    def test_activities_structure(self, client):
         """Test that activities have the correct structure"""
         response = client.get("/activities")
         data = response.json()
@@ -126,22 +51,20 @@ class TestActivitiesEndpoint:
 class TestSignupEndpoint:
     """Tests for the /activities/{activity_name}/signup endpoint"""
     
-    def test_signup_new_participant(self, client, reset_activities):
+    def test_signup_new_participant(self, client, baseline_participants):
         """Test signing up a new participant"""
+        assert "newstudent@mergington.edu" not in baseline_participants["Chess Club"]
+
         response = client.post(
             "/activities/Chess Club/signup?email=newstudent@mergington.edu"
         )
         assert response.status_code == 200
-        
-        data = response.json()
-        assert "Signed up" in data["message"]
+        assert b"Signed up" in response.content
         
         # Verify participant was added
-        activities_response = client.get("/activities")
-        updated_activity = activities_response.json()["Chess Club"]
-        assert "newstudent@mergington.edu" in updated_activity["participants"]
+        assert "newstudent@mergington.edu" in activities["Chess Club"]["participants"]
     
-    def test_signup_duplicate_participant(self, client, reset_activities):
+    def test_signup_duplicate_participant(self, client):
         """Test that duplicate signups are rejected"""
         # First signup
         response1 = client.post(
@@ -155,60 +78,30 @@ class TestSignupEndpoint:
         )
         assert response2.status_code == 400
         assert "already signed up" in response2.json()["detail"]
-    
-    def test_signup_nonexistent_activity(self, client, reset_activities):
-        """Test signup to a nonexistent activity"""
-        response = client.post(
-            "/activities/Nonexistent Club/signup?email=test@mergington.edu"
-        )
-        assert response.status_code == 404
-        assert "Activity not found" in response.json()["detail"]
-    
-    def test_signup_already_exists(self, client, reset_activities):
-        """Test signup for already registered participant"""
-        response = client.post(
-            "/activities/Chess Club/signup?email=michael@mergington.edu"
-        )
-        assert response.status_code == 400
-        assert "already signed up" in response.json()["detail"]
 
 
 class TestUnregisterEndpoint:
     """Tests for the /activities/{activity_name}/unregister endpoint"""
     
-    def test_unregister_participant(self, client, reset_activities):
+    def test_unregister_participant(self, client, baseline_participants):
         """Test unregistering a participant"""
+        assert "michael@mergington.edu" in baseline_participants["Chess Club"]
+
         response = client.delete(
             "/activities/Chess Club/unregister?email=michael@mergington.edu"
         )
         assert response.status_code == 200
-        
-        data = response.json()
-        assert "Unregistered" in data["message"]
+        assert b"Unregistered" in response.content
         
         # Verify participant was removed
-        activities_response = client.get("/activities")
-        updated_activity = activities_response.json()["Chess Club"]
-        assert "michael@mergington.edu" not in updated_activity["participants"]
-    
-    def test_unregister_nonexistent_participant(self, client, reset_activities):
-        """Test unregistering a participant who isn't registered"""
-        response = client.delete(
-            "/activities/Chess Club/unregister?email=nonexistent@mergington.edu"
-        )
-        assert response.status_code == 400
-        assert "not registered" in response.json()["detail"]
+        assert "michael@mergington.edu" not in activities["Chess Club"]["participants"]
     
-    def test_unregister_from_nonexistent_activity(self, client, reset_activities):
-        """Test unregistering from a nonexistent activity"""
-        response = client.delete(
-            "/activities/Nonexistent Club/unregister?email=test@mergington.edu"
-        )
-        assert response.status_code == 404
-        assert "Activity not found" in response.json()["detail"]
-    
-    def test_unregister_multiple_participants(self, client, reset_activities):
+    def test_unregister_multiple_participants(self, client, baseline_participants):
         """Test unregistering multiple participants from the same activity"""
+        assert baseline_participants["Chess Club"] == {
+            "michael@mergington.edu", "daniel@mergington.edu"
+        }
+
         # Unregister first participant
         response1 = client.delete(
             "/activities/Chess Club/unregister?email=michael@mergington.edu"
@@ -222,16 +115,53 @@ class TestUnregisterEndpoint:
         assert response2.status_code == 200
         
         # Verify both participants were removed
-        activities_response = client.get("/activities")
-        updated_activity = activities_response.json()["Chess Club"]
-        assert len(updated_activity["participants"]) == 0
+        assert len(activities["Chess Club"]["participants"]) == 0
+
+
+class TestErrorResponses:
+    """Tests for the error responses shared by the signup and unregister endpoints"""
+
+    @pytest.mark.parametrize("method,url,status_code,detail", [
+        pytest.param(
+            "post",
+            "/activities/Nonexistent Club/signup?email=test@mergington.edu",
+            404, "Activity not found",
+            id="signup-nonexistent-activity",
+        ),
+        pytest.param(
+            "post",
+            "/activities/Chess Club/signup?email=michael@mergington.edu",
+            400, "already signed up",
+            id="signup-already-registered",
+        ),
+        pytest.param(
+            "delete",
+            "/activities/Nonexistent Club/unregister?email=test@mergington.edu",
+            404, "Activity not found",
+            id="unregister-nonexistent-activity",
+        ),
+        pytest.param(
+            "delete",
+            "/activities/Chess Club/unregister?email=nonexistent@mergington.edu",
+            400, "not registered",
+            id="unregister-not-registered",
+        ),
+    ])
+    def test_error_response(self, client, method, url, status_code, detail):
+        """Test that invalid requests are rejected with the expected error"""
+        response = getattr(client, method)(url)
+        assert response.status_code == status_code
+        assert detail in response.json()["detail"]
 
 
 class TestIntegration:
     """Integration tests for complete workflows"""
     
-    def test_signup_and_unregister_workflow(self, client, reset_activities):
+    def test_signup_and_unregister_workflow(self, client, baseline_participants):
         """Test complete workflow: signup and unregister"""
+        assert "newartist@mergington.edu" not in baseline_participants["Art Club"]
+        baseline_count = len(baseline_participants["Art Club"])
+
         # Signup
         signup_response = client.post(
             "/activities/Art Club/signup?email=newartist@mergington.edu"
@@ -239,10 +169,9 @@ class TestIntegration:
         assert signup_response.status_code == 200
         
         # Verify added
-        check_response = client.get("/activities")
-        activity = check_response.json()["Art Club"]
-        assert "newartist@mergington.edu" in activity["participants"]
-        initial_count = len(activity["participants"])
+        participants = activities["Art Club"]["participants"]
+        assert "newartist@mergington.edu" in participants
+        assert len(participants) == baseline_count + 1
         
         # Unregister
         unregister_response = client.delete(
@@ -251,41 +180,60 @@ class TestIntegration:
         assert unregister_response.status_code == 200
         
         # Verify removed
-        final_response = client.get("/activities")
-        final_activity = final_response.json()["Art Club"]
-        assert "newartist@mergington.edu" not in final_activity["participants"]
-        assert len(final_activity["participants"]) == initial_count - 1
+        participants = activities["Art Club"]["participants"]
+        assert "newartist@mergington.edu" not in participants
+        assert len(participants) == baseline_count
     
-    def test_multiple_signups_and_unregisters(self, client, reset_activities):
+    def test_multiple_signups_and_unregisters(self):
         """Test multiple signups and unregisters"""
         emails = [
             "student1@mergington.edu",
             "student2@mergington.edu",
             "student3@mergington.edu"
         ]
-        
-        # Signup all
-        for email in emails:
-            response = client.post(
-                f"/activities/Debate Team/signup?email={email}"
-            )
+        signup_urls = [
+            f"/activities/Debate Team/signup?email={email}" for email in emails
+        ]
+        unregister_urls = [
+            f"/activities/Debate Team/unregister?email={email}" for email in emails
+        ]
+
+        async def run_workflow():
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(
+                transport=transport, base_url="http://test"
+            ) as async_client:
+                # Signup all; distinct emails don't conflict, so the
+                # requests can be dispatched concurrently
+                signup_responses = await asyncio.gather(
+                    *[async_client.post(url) for url in signup_urls]
+                )
+                check_response = await async_client.get("/activities")
+
+                # Unregister all
+                unregister_responses = await asyncio.gather(
+                    *[async_client.delete(url) for url in unregister_urls]
+                )
+                final_response = await async_client.get("/activities")
+
+            return (signup_responses, check_response,
+                    unregister_responses, final_response)
+
+        (signup_responses, check_response,
+         unregister_responses, final_response) = asyncio.run(run_workflow())
+
+        for response in signup_responses:
             assert response.status_code == 200
-        
+
         # Verify all added
-        check_response = client.get("/activities")
         activity = check_response.json()["Debate Team"]
         for email in emails:
             assert email in activity["participants"]
-        
-        # Unregister all
-        for email in emails:
-            response = client.delete(
-                f"/activities/Debate Team/unregister?email={email}"
-            )
+
+        for response in unregister_responses:
             assert response.status_code == 200
-        
+
         # Verify all removed
-        final_response = client.get("/activities")
         final_activity = final_response.json()["Debate Team"]
         for email in emails:
             assert email not in final_activity["participants"]